@@ -2,26 +2,210 @@
 Base classes and data models for the AI Knowledge Crawler framework.
 """
 
+import os
 import time
+import json
+import hashlib
 import logging
+import tempfile
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import ClassVar, FrozenSet, List, Dict, Optional, Sequence, Tuple
 from dataclasses import dataclass, asdict
+from pathlib import Path
+from urllib.parse import urlsplit
+import orjson
 import requests
-import backoff
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from dateutil import parser as date_parser
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - fall back to plain substring scans
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Longest Retry-After wait honoured per retry; with two retries a throttled
+# feed holds its crawler thread for at most about 30 seconds
+RETRY_AFTER_MAX = 15
+
+class _BoundedRetry(Retry):
+    """Retry that caps server-requested Retry-After waits at RETRY_AFTER_MAX.
+
+    urllib3 otherwise sleeps for whatever the server asks, up to six hours.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_MAX)
+
+# Up to three attempts per GET, retrying connection errors and transient
+# statuses with exponential backoff (honouring Retry-After, within bounds)
+REQUEST_RETRY = _BoundedRetry(
+    total=2,
+    backoff_factor=1.0,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+)
+
+# Source tags that mark every entry of a feed as AI content (lowercase)
+AI_TAG_INDICATORS = frozenset({
+    'ai', 'ml', 'artificial-intelligence', 'machine-learning', 'neural', 'deep-learning'
+})
+
+# Each article's date is checked by both is_within_timeframe and
+# is_yesterday_priority, and feeds often repeat pubDate strings
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> datetime:
+    """Parse a feed date string into a timezone-aware datetime.
+
+    API sources (arXiv, Hugging Face) emit ISO 8601 and RSS feeds almost always
+    use RFC 2822; the stdlib parses both much faster than dateutil, which is
+    only used for anything else.
+    """
+    try:
+        parsed = datetime.fromisoformat(date_str)
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(date_str)
+        except (TypeError, ValueError):
+            parsed = date_parser.parse(date_str)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+class KeywordMatcher:
+    """Case-insensitive substring matching against a fixed keyword list"""
+
+    def __init__(self, keywords):
+        self.keywords = tuple(keyword.lower() for keyword in keywords)
+        self._automaton = None
+
+        # Aho-Corasick finds every keyword in one pass over the text; without it
+        # scan the pre-lowered keywords, which still beats a regex alternation
+        if ahocorasick is not None and self.keywords:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+
+    def search(self, text: str) -> bool:
+        """Return True if any keyword occurs in the (lowercased) text"""
+        if not text:
+            return False
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        return any(keyword in text for keyword in self.keywords)
+
+class FeedCache:
+    """On-disk store of fetched feed bodies plus their HTTP validators.
+
+    Lets crawlers send conditional requests (If-None-Match / If-Modified-Since)
+    and reuse the stored body when the server answers 304 Not Modified.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        if cache_dir is None:
+            root = os.getenv("AI_NEWS_CACHE_DIR") or Path.home() / ".cache" / "ai-news-agent"
+            cache_dir = Path(root) / "feeds"
+        self.cache_dir = Path(cache_dir)
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Validator headers for url, empty when nothing usable is cached"""
+        meta_path, body_path = self._paths(url)
+        try:
+            if not body_path.exists():
+                return {}
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def load(self, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Return the cached (body, content type) for url, if any"""
+        meta_path, body_path = self._paths(url)
+        try:
+            body = body_path.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            content_type = json.loads(meta_path.read_text(encoding='utf-8')).get('content_type')
+        except (OSError, ValueError):
+            content_type = None
+        return body, content_type
+
+    def store(self, url: str, response: requests.Response):
+        """Remember the response body if the server sent validators for it"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+
+        meta = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_type': response.headers.get('Content-Type'),
+        }
+        meta_path, body_path = self._paths(url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(body_path, response.content)
+            self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError as e:
+            self.logger.warning(f"Could not cache feed {url}: {e}")
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """Replace path with data in one step.
+
+        Sources can share a feed URL and crawl concurrently, so a plain write
+        could be read, or interleaved with another, half-way through.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+@lru_cache(maxsize=8)
+def get_keyword_matcher(keywords: FrozenSet[str]) -> KeywordMatcher:
+    """Return a shared matcher for a keyword set, built once per process"""
+    return KeywordMatcher(keywords)
+
+@dataclass(slots=True)
 class Article:
-    """Standardized output schema for all crawled articles"""
+    """Standardized output schema for all crawled articles.
+
+    Slotted, so instances carry no per-object __dict__ (requires Python 3.10+).
+    """
     title: str
     authors: List[str]
     date: str
     url: str
-    tags: List[str]
+    tags: Tuple[str, ...]
     source: str
     summary: Optional[str] = None
     priority: str = "medium"
@@ -35,62 +219,105 @@ class Article:
         """Convert article to dictionary"""
         return asdict(self)
 
+    def to_json(self) -> bytes:
+        """Serialize article to UTF-8 JSON without building an intermediate dict"""
+        return orjson.dumps(self)
+
     def __str__(self) -> str:
         return f"Article(title='{self.title[:50]}...', source='{self.source}', priority='{self.priority}')"
 
 class BaseCrawler(ABC):
     """Base class for all crawlers with common functionality"""
 
+    # AI keywords for relevance filtering, shared by every crawler
+    AI_KEYWORDS: ClassVar[FrozenSet[str]] = frozenset([
+        'artificial intelligence', 'machine learning', 'deep learning',
+        'neural network', 'llm', 'large language model', 'gpt', 'claude',
+        'openai', 'anthropic', 'google ai', 'deepmind', 'chatbot',
+        'generative ai', 'foundation model', 'transformer', 'ai safety',
+        'ai ethics', 'ai regulation', 'computer vision', 'nlp',
+        'natural language processing', 'ai chip', 'nvidia', 'ai startup',
+        'ai funding', 'ai research', 'robotics ai', 'autonomous',
+        'ai agent', 'multimodal ai', 'ai model', 'ai training',
+        'bert', 'pytorch', 'tensorflow', 'huggingface', 'stable diffusion'
+    ])
+
+    # Priority keywords for ranking
+    PRIORITY_KEYWORDS: ClassVar[FrozenSet[str]] = frozenset([
+        'breakthrough', 'new model', 'release', 'announcement',
+        'funding', 'acquisition', 'partnership', 'open source',
+        'research paper', 'sota', 'state-of-the-art', 'benchmark',
+        'regulation', 'policy', 'safety', 'ethics'
+    ])
+
+    _ai_matcher: ClassVar[KeywordMatcher] = get_keyword_matcher(AI_KEYWORDS)
+    _priority_matcher: ClassVar[KeywordMatcher] = get_keyword_matcher(PRIORITY_KEYWORDS)
+
+    # One keep-alive connection pool shared by every crawler, created on first use
+    _shared_session: ClassVar[Optional[requests.Session]] = None
+    _session_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Return the process-wide crawler session, creating it if needed"""
+        with cls._session_lock:
+            if BaseCrawler._shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=16, max_retries=REQUEST_RETRY)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({
+                    'User-Agent': 'AI-Knowledge-Crawler/1.0 (Research Purpose; +https://github.com/ai-knowledge-crawler)',
+                    # Every encoding urllib3 can decode here: gzip and deflate,
+                    # plus br / zstd when brotli / zstandard are installed
+                    'Accept-Encoding': ACCEPT_ENCODING,
+                })
+                BaseCrawler._shared_session = session
+            return BaseCrawler._shared_session
+
+    # Earliest time (time.monotonic) each host may be requested again; shared
+    # so crawlers running in parallel stay polite to hosts they have in common
+    _host_next_slot: ClassVar[Dict[str, float]] = {}
+    _host_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, name: str, throttle_delay: float = 1.0):
         self.name = name
         self.throttle_delay = throttle_delay
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'AI-Knowledge-Crawler/1.0 (Research Purpose; +https://github.com/ai-knowledge-crawler)'
-        })
+        self.session = self._get_session()
         self.last_request_time = 0
+        self._reset_crawl_clock()
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-
-        # AI keywords for relevance filtering
-        self.ai_keywords = [
-            'artificial intelligence', 'machine learning', 'deep learning',
-            'neural network', 'llm', 'large language model', 'gpt', 'claude',
-            'openai', 'anthropic', 'google ai', 'deepmind', 'chatbot',
-            'generative ai', 'foundation model', 'transformer', 'ai safety',
-            'ai ethics', 'ai regulation', 'computer vision', 'nlp',
-            'natural language processing', 'ai chip', 'nvidia', 'ai startup',
-            'ai funding', 'ai research', 'robotics ai', 'autonomous',
-            'ai agent', 'multimodal ai', 'ai model', 'ai training',
-            'bert', 'pytorch', 'tensorflow', 'huggingface', 'stable diffusion'
-        ]
-
-        # Priority keywords for ranking
-        self.priority_keywords = [
-            'breakthrough', 'new model', 'release', 'announcement',
-            'funding', 'acquisition', 'partnership', 'open source',
-            'research paper', 'sota', 'state-of-the-art', 'benchmark',
-            'regulation', 'policy', 'safety', 'ethics'
-        ]
+        self.feed_cache = FeedCache()
 
     def throttle(self):
         """Implement polite crawling with delays"""
-        current_time = time.time()
+        # Monotonic, like throttle_host, so wall-clock adjustments can't
+        # stretch or skip the delay
+        current_time = time.monotonic()
         time_since_last = current_time - self.last_request_time
         if time_since_last < self.throttle_delay:
             sleep_time = self.throttle_delay - time_since_last
             self.logger.debug(f"Throttling for {sleep_time:.2f}s")
             time.sleep(sleep_time)
-        self.last_request_time = time.time()
-
-    @backoff.on_exception(
-        backoff.expo,
-        requests.RequestException,
-        max_tries=3,
-        max_time=30
-    )
+        self.last_request_time = time.monotonic()
+
+    def throttle_host(self, url: str):
+        """Space requests to url's host by throttle_delay across all crawlers"""
+        host = urlsplit(url).netloc
+        # Reserve a slot under the lock, then sleep outside it
+        with BaseCrawler._host_lock:
+            now = time.monotonic()
+            slot = max(now, BaseCrawler._host_next_slot.get(host, 0.0))
+            BaseCrawler._host_next_slot[host] = slot + self.throttle_delay
+
+        wait = slot - now
+        if wait > 0:
+            self.logger.debug(f"Throttling {host} for {wait:.2f}s")
+            time.sleep(wait)
+
     def make_request(self, url: str, **kwargs) -> requests.Response:
         """Make HTTP request with retries and error handling"""
-        self.throttle()
+        self.throttle_host(url)
         self.logger.debug(f"Making request to: {url}")
 
         # Set default timeout if not provided
@@ -102,38 +329,73 @@ class BaseCrawler(ABC):
         self.logger.debug(f"Request successful: {response.status_code}")
         return response
 
+    def fetch_cached(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[bytes, Optional[str]]:
+        """Fetch url's body and content type, skipping the download when unchanged.
+
+        Sends the validators stored by the previous crawl and reuses the cached
+        body on 304 Not Modified. The body is still parsed every crawl, since
+        the date window and priorities depend on when the crawl runs. url must
+        include any query string, as it is the cache key.
+        """
+        request_headers = dict(headers or {})
+        request_headers.update(self.feed_cache.conditional_headers(url))
+        response = self.make_request(url, headers=request_headers)
+
+        if response.status_code == 304:
+            cached = self.feed_cache.load(url)
+            if cached is not None:
+                self.logger.info(f"{self.name} not modified since last crawl, using cached copy")
+                return cached
+            response = self.make_request(url, headers=headers)
+
+        self.feed_cache.store(url, response)
+        return response.content, response.headers.get('Content-Type')
+
+    def _reset_crawl_clock(self):
+        """Pin the reference time used for date filtering during one crawl"""
+        self.crawl_started_at = datetime.now(timezone.utc)
+        self._cutoff_dates: Dict[int, datetime] = {}
+
+        yesterday = self.crawl_started_at - timedelta(days=1)
+        self._yesterday_start = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
+        self._yesterday_end = yesterday.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+    def _cutoff_date(self, days_back: int) -> datetime:
+        """Return the (cached) oldest acceptable article date for this crawl"""
+        cutoff_date = self._cutoff_dates.get(days_back)
+        if cutoff_date is None:
+            cutoff_date = self.crawl_started_at - timedelta(days=days_back)
+            self._cutoff_dates[days_back] = cutoff_date
+        return cutoff_date
+
     def is_within_timeframe(self, date_str: str, days_back: int = 3) -> bool:
         """Check if article is within specified timeframe (last 3 days)"""
         try:
             if not date_str:
                 return True
 
-            article_date = date_parser.parse(date_str)
-            if article_date.tzinfo is None:
-                article_date = article_date.replace(tzinfo=timezone.utc)
-
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+            article_date = _parse_date(date_str)
+            cutoff_date = self._cutoff_date(days_back)
             is_recent = article_date >= cutoff_date
 
-            self.logger.debug(f"Date check: {date_str} -> {is_recent}")
+            self.logger.debug("Date check: %s -> %s", date_str, is_recent)
             return is_recent
 
         except Exception as e:
             self.logger.warning(f"Date parsing error for {date_str}: {e}")
             return True  # Include if we can't parse date
 
-    def is_ai_relevant(self, title: str, summary: str = "", tags: List[str] = None) -> bool:
+    def is_ai_relevant(self, title: str, summary: str = "", tags: Sequence[str] = ()) -> bool:
         """Check if content is AI-relevant using keywords"""
         # If tags explicitly contain AI indicators, consider relevant
-        if tags and any(tag.lower() in ['ai', 'ml', 'artificial-intelligence', 'machine-learning', 'neural', 'deep-learning']
-                       for tag in tags):
+        if tags and any(tag.lower() in AI_TAG_INDICATORS for tag in tags):
             return True
 
-        # Check content for AI keywords
-        text = f"{title} {summary}".lower()
-        is_relevant = any(keyword.lower() in text for keyword in self.ai_keywords)
+        # Check content for AI keywords, title first since it is short
+        is_relevant = (self._ai_matcher.search(title.lower())
+                       or self._ai_matcher.search(summary.lower() if summary else ""))
 
-        self.logger.debug(f"AI relevance check: '{title[:30]}...' -> {is_relevant}")
+        self.logger.debug("AI relevance check: '%.30s...' -> %s", title, is_relevant)
         return is_relevant
 
     def is_yesterday_priority(self, date_str: str) -> bool:
@@ -142,15 +404,9 @@ class BaseCrawler(ABC):
             if not date_str:
                 return False
 
-            article_date = date_parser.parse(date_str)
-            if article_date.tzinfo is None:
-                article_date = article_date.replace(tzinfo=timezone.utc)
-
-            yesterday = datetime.now(timezone.utc) - timedelta(days=1)
-            yesterday_start = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
-            yesterday_end = yesterday.replace(hour=23, minute=59, second=59, microsecond=999999)
+            article_date = _parse_date(date_str)
 
-            return yesterday_start <= article_date <= yesterday_end
+            return self._yesterday_start <= article_date <= self._yesterday_end
 
         except Exception:
             return False
@@ -162,8 +418,8 @@ class BaseCrawler(ABC):
             return "high"
 
         # Check for high-value keywords
-        text = f"{title} {summary}".lower()
-        if any(keyword.lower() in text for keyword in self.priority_keywords):
+        # Same single-pass matching as the AI relevance check
+        if self._priority_matcher.search(f"{title} {summary}".lower()):
             return "high"
 
         # Default to medium priority
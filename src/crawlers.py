@@ -4,11 +4,9 @@ Specialized crawler implementations for different types of sources.
 
 import logging
 from typing import List
-from urllib.parse import urljoin
-from datetime import datetime, timezone
-import feedparser
-import arxiv
-from bs4 import BeautifulSoup
+from urllib.parse import urlencode, urljoin
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 
 try:
@@ -18,22 +16,62 @@ except ImportError:  # pragma: no cover - allow direct script execution
 
 logger = logging.getLogger(__name__)
 
+# Same preference order feedparser sends when it fetches a URL itself
+FEED_ACCEPT_HEADER = ('application/atom+xml,application/rdf+xml,application/rss+xml,'
+                      'application/xml;q=0.9,text/xml;q=0.2,*/*;q=0.1')
+
+# AI/ML terms for GitHub repositories, matched against lowercased text in one
+# regex pass. "ai" and "ml" must stand alone (so "maintain" or "html" don't
+# match) while longer terms may be embedded, e.g. "transformers", "nanogpt".
+GITHUB_AI_PATTERN = re.compile(
+    r'(?<![a-z0-9])(?:ai|ml)(?![a-z0-9])'
+    r'|machine learning|neural|deep learning|transformer|llm|gpt|bert|pytorch|tensorflow'
+)
+
+# Newest text-generation models first; encoded once since the query never changes
+HF_MODELS_QUERY = urlencode({
+    "sort": "createdAt",
+    "direction": "-1",
+    "limit": 100,
+    "filter": "text-generation"
+})
+
+# lxml's C parser builds the soup faster than the pure-Python html.parser.
+# CSS selectors need no precompiling: soupsieve caches compiled patterns.
+HTML_PARSER = 'lxml'
+
+# Only the listing cards are used from GitHub trending and Papers with Code, so
+# skip building soup for the surrounding navigation, scripts and footers
+GITHUB_REPO_STRAINER = SoupStrainer('article', class_='Box-row')
+PWC_PAPER_STRAINER = SoupStrainer(class_='infinite-item')
+
 class RSSCrawler(BaseCrawler):
     """Generic RSS feed crawler with AI content filtering"""
 
     def __init__(self, name: str, rss_url: str, tags: List[str], throttle_delay: float = 1.0):
         super().__init__(name, throttle_delay)
         self.rss_url = rss_url
-        self.tags = tags
+        self.tags = tuple(tags)
 
     def crawl(self) -> List[Article]:
         """Crawl RSS feed and return articles"""
+        # Imported on first crawl so loading this module doesn't pay for it
+        import feedparser
+
         articles = []
+        self._reset_crawl_clock()
 
         try:
             self.logger.info(f"Crawling RSS feed: {self.name}")
-            self.throttle()
-            feed = feedparser.parse(self.rss_url)
+            body, content_type = self.fetch_cached(self.rss_url, headers={'Accept': FEED_ACCEPT_HEADER})
+
+            # Hand feedparser the headers it would have seen fetching the URL
+            # itself: content-location resolves relative links and the
+            # content type carries the charset
+            response_headers = {'content-location': self.rss_url}
+            if content_type:
+                response_headers['content-type'] = content_type
+            feed = feedparser.parse(body, response_headers=response_headers)
 
             if feed.bozo:
                 self.logger.warning(f"RSS parsing warning for {self.name}: {feed.bozo_exception}")
@@ -62,7 +100,7 @@ class RSSCrawler(BaseCrawler):
                     authors=authors,
                     date=date_str,
                     url=entry.link,
-                    tags=self.tags.copy(),
+                    tags=self.tags,
                     source=self.name,
                     summary=summary[:500] if summary else None,
                     priority=priority
@@ -88,16 +126,17 @@ class WebScrapingCrawler(BaseCrawler):
         self.title_selector = title_selector
         self.date_selector = date_selector
         self.link_selector = link_selector
-        self.tags = tags
+        self.tags = tuple(tags)
 
     def crawl(self) -> List[Article]:
         """Crawl website using BeautifulSoup"""
         articles = []
+        self._reset_crawl_clock()
 
         try:
             self.logger.info(f"Scraping website: {self.name}")
             response = self.make_request(self.base_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
 
             article_elements = soup.select(self.article_selector)
 
@@ -131,7 +170,7 @@ class WebScrapingCrawler(BaseCrawler):
                         authors=[],
                         date=date_str,
                         url=link,
-                        tags=self.tags.copy(),
+                        tags=self.tags,
                         source=self.name,
                         priority=priority
                     )
@@ -157,39 +196,47 @@ class ArxivCrawler(BaseCrawler):
 
     def crawl(self) -> List[Article]:
         """Crawl arXiv for recent AI/ML papers"""
+        # The arxiv client is the heaviest import here (~90 ms, feedparser
+        # included) and only this crawler needs it
+        import arxiv
+
         articles = []
+        self._reset_crawl_clock()
 
         try:
             self.logger.info("Crawling arXiv for AI/ML papers")
+            self.throttle()
 
-            for category in self.categories:
-                self.throttle()
-
-                query = f"cat:{category}"
-                search = arxiv.Search(
-                    query=query,
-                    max_results=50,
-                    sort_by=arxiv.SortCriterion.SubmittedDate
-                )
-
-                for paper in search.results():
-                    if not self.is_within_timeframe(paper.published.isoformat()):
-                        continue
+            # One request for all categories, with the date window applied
+            # server-side instead of fetching 50 papers per category and
+            # discarding the old ones
+            since = self._cutoff_date(3).strftime('%Y%m%d%H%M')
+            until = self.crawl_started_at.strftime('%Y%m%d%H%M')
+            categories = ' OR '.join(f"cat:{category}" for category in self.categories)
+            search = arxiv.Search(
+                query=f"({categories}) AND submittedDate:[{since} TO {until}]",
+                max_results=50 * len(self.categories),
+                sort_by=arxiv.SortCriterion.SubmittedDate
+            )
+
+            for paper in search.results():
+                date_str = paper.published.isoformat()
+                if not self.is_within_timeframe(date_str):
+                    continue
 
-                    date_str = paper.published.isoformat()
-                    priority = self.get_priority(paper.title, date_str, paper.summary)
+                priority = self.get_priority(paper.title, date_str, paper.summary)
 
-                    article = Article(
-                        title=paper.title,
-                        authors=[author.name for author in paper.authors],
-                        date=date_str,
-                        url=paper.entry_id,
-                        tags=['arxiv', 'research', 'academic', category],
-                        source="arXiv",
-                        summary=paper.summary[:500] if paper.summary else None,
-                        priority=priority
-                    )
-                    articles.append(article)
+                article = Article(
+                    title=paper.title,
+                    authors=[author.name for author in paper.authors],
+                    date=date_str,
+                    url=paper.entry_id,
+                    tags=('arxiv', 'research', 'academic', paper.primary_category),
+                    source="arXiv",
+                    summary=paper.summary[:500] if paper.summary else None,
+                    priority=priority
+                )
+                articles.append(article)
 
             self.logger.info(f"Collected {len(articles)} papers from arXiv")
 
@@ -208,14 +255,17 @@ class GitHubTrendingCrawler(BaseCrawler):
     def crawl(self) -> List[Article]:
         """Crawl GitHub trending AI/ML repositories"""
         articles = []
+        self._reset_crawl_clock()
 
         try:
             self.logger.info("Crawling GitHub trending AI/ML repositories")
+            # Trending repos have no publish date; stamp them all with the crawl time
+            crawl_date = self.crawl_started_at.isoformat()
 
             for period in ['daily', 'weekly']:
                 url = f"{self.base_url}?since={period}&l=python"
                 response = self.make_request(url)
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=GITHUB_REPO_STRAINER)
 
                 repo_articles = soup.select('article.Box-row')
 
@@ -232,17 +282,15 @@ class GitHubTrendingCrawler(BaseCrawler):
                         repo_url = urljoin("https://github.com", title_elem['href'])
 
                         # Filter for AI/ML repositories
-                        if not any(keyword in (repo_name + description).lower()
-                                 for keyword in ['ai', 'ml', 'machine learning', 'neural', 'deep learning',
-                                               'transformer', 'llm', 'gpt', 'bert', 'pytorch', 'tensorflow']):
+                        if not GITHUB_AI_PATTERN.search(f"{repo_name} {description}".lower()):
                             continue
 
                         article = Article(
                             title=f"Trending: {repo_name}",
                             authors=[],
-                            date=datetime.now(timezone.utc).isoformat(),
+                            date=crawl_date,
                             url=repo_url,
-                            tags=['github', 'trending', 'repository', 'open-source', period],
+                            tags=('github', 'trending', 'repository', 'open-source', period),
                             source="GitHub Trending",
                             summary=description,
                             priority="medium"
@@ -266,23 +314,19 @@ class HuggingFaceAPICrawler(BaseCrawler):
     def __init__(self, throttle_delay: float = 2.0):
         super().__init__("Hugging Face Models", throttle_delay)
         self.api_url = "https://huggingface.co/api/models"
+        # The query string is part of the cache key, so bake it into the URL
+        self.models_url = f"{self.api_url}?{HF_MODELS_QUERY}"
 
     def crawl(self) -> List[Article]:
         """Crawl Hugging Face model hub for recent models"""
         articles = []
+        self._reset_crawl_clock()
 
         try:
             self.logger.info("Crawling Hugging Face model hub")
 
-            params = {
-                "sort": "createdAt",
-                "direction": "-1",
-                "limit": 100,
-                "filter": "text-generation"
-            }
-
-            response = self.make_request(self.api_url, params=params)
-            models = response.json()
+            body, _ = self.fetch_cached(self.models_url)
+            models = orjson.loads(body)
 
             for model in models:
                 try:
@@ -306,7 +350,7 @@ class HuggingFaceAPICrawler(BaseCrawler):
                         authors=[author] if author else [],
                         date=created_at,
                         url=f"https://huggingface.co/{model_id}",
-                        tags=['huggingface', 'model', 'release', 'ml', 'nlp'],
+                        tags=('huggingface', 'model', 'release', 'ml', 'nlp'),
                         source="Hugging Face Models",
                         summary=f"Downloads: {downloads}, Likes: {likes}",
                         priority=priority
@@ -334,13 +378,14 @@ class PapersWithCodeCrawler(BaseCrawler):
     def crawl(self) -> List[Article]:
         """Crawl Papers with Code for latest papers"""
         articles = []
+        self._reset_crawl_clock()
 
         try:
             self.logger.info("Crawling Papers with Code")
 
             url = f"{self.base_url}/latest"
             response = self.make_request(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=PWC_PAPER_STRAINER)
 
             paper_cards = soup.select('.infinite-item')
 
@@ -370,7 +415,7 @@ class PapersWithCodeCrawler(BaseCrawler):
                         authors=authors,
                         date=date_str,
                         url=paper_url,
-                        tags=['papers-with-code', 'research', 'implementation', 'sota'],
+                        tags=('papers-with-code', 'research', 'implementation', 'sota'),
                         source="Papers with Code",
                         priority=priority
                     )
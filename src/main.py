@@ -8,6 +8,7 @@ import os
 import sys
 import json
 import logging
+import logging.handlers
 from datetime import datetime
 from typing import Optional
 
@@ -25,17 +26,26 @@ for candidate in (".env.local", ".env"):
         load_dotenv(dotenv_path, override=False)
 
 from news_collector import NewsCollector
-from ai_summarizer import AISummarizer
+from ai_summarizer import AISummarizer, MAX_PROMPT_ARTICLES
 from notion_updater import NotionUpdater
 
-# Configure logging
+# Configure logging. FileHandler flushes after every record, so buffer file
+# records in memory; they are written when 1024 accumulate, when an ERROR is
+# logged, or by logging.shutdown() at interpreter exit. basicConfig formats
+# only the handlers it is given and MemoryHandler passes records on as they
+# are, so the file handler gets the formatter itself. force replaces the
+# console-only handler the imported modules already installed.
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+log_file_handler = logging.FileHandler('ai_news_agent.log', delay=True)
+log_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('ai_news_agent.log')
-    ]
+        logging.handlers.MemoryHandler(capacity=1024, target=log_file_handler)
+    ],
+    force=True
 )
 logger = logging.getLogger(__name__)
 
@@ -44,12 +54,13 @@ class AINewsAgent:
     
     def __init__(self):
         """Initialize the AI News Agent with all required components"""
+        # Validate environment variables first, so a missing key fails fast
+        # instead of after every crawler and client has been constructed
+        self.validate_environment()
+        
         self.news_collector = NewsCollector()
         self.ai_summarizer = AISummarizer()
         self.notion_updater = NotionUpdater()
-        
-        # Validate environment variables
-        self.validate_environment()
     
     def validate_environment(self):
         """Validate that all required environment variables are set"""
@@ -114,6 +125,16 @@ class AINewsAgent:
             update_success = self.notion_updater.update_page_content(enhanced_summary)
             
             if update_success:
+                # Only now are the articles published. A failed run retries
+                # them, and so does one where the model failed: the fallback
+                # summary lists just a few titles without analysing them.
+                # Likewise only the articles sent to the model in full count;
+                # the rest were passed as "Also noted" titles and stay eligible.
+                if self.ai_summarizer.is_fallback_summary(summary):
+                    logger.warning("⚠️ Published a fallback summary; articles will be retried next run")
+                else:
+                    self.news_collector.mark_published(news_data['articles'][:MAX_PROMPT_ARTICLES])
+                
                 end_time = datetime.now()
                 duration = (end_time - start_time).total_seconds()
                 
@@ -129,20 +150,22 @@ class AINewsAgent:
     
     def create_minimal_update(self) -> dict:
         """Create minimal update when no articles are collected"""
-        current_date = datetime.now().strftime('%B %d, %Y')
+        now = datetime.now()
+        current_date = now.strftime('%B %d, %Y')
+        now_iso = now.isoformat()
         
         return {
             'articles': [{
                 'title': 'No new AI articles found',
                 'summary': f'No significant AI news articles were found for {current_date}.',
                 'source': 'System',
-                'published': datetime.now().isoformat(),
+                'published': now_iso,
                 'link': '#',
                 'priority': 'low'
             }],
             'trending_topics': [],
-            'collection_time': datetime.now().isoformat(),
-            'total_sources': len(self.news_collector.rss_feeds)
+            'collection_time': now_iso,
+            'total_sources': len(self.news_collector.crawlers)
         }
 
 def main():
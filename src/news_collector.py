@@ -3,19 +3,24 @@ AI Knowledge Crawler Framework
 A modular system for collecting AI knowledge from diversified sources with standardized output schema
 """
 
-import json
-import jsonlines
+import os
 import logging
 import time
 import re
+import sqlite3
+from contextlib import closing, nullcontext
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import List
+from typing import Iterable, List, Optional, Set
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
+import orjson
 from dotenv import load_dotenv
 
 try:
-    from .crawler_base import BaseCrawler, Article
+    from .crawler_base import BaseCrawler, Article, _parse_date
     from .crawlers import (
         RSSCrawler,
         WebScrapingCrawler,
@@ -26,7 +31,7 @@ try:
     )
     from .crawler_config import CrawlerConfig
 except ImportError:  # pragma: no cover - allow direct script execution
-    from crawler_base import BaseCrawler, Article
+    from crawler_base import BaseCrawler, Article, _parse_date
     from crawlers import (
         RSSCrawler,
         WebScrapingCrawler,
@@ -46,12 +51,125 @@ for candidate in (".env.local", ".env"):
     if dotenv_path.exists():
         load_dotenv(dotenv_path, override=False)
 
+# Priority levels from most to least important
+PRIORITY_LEVELS = ("high", "medium", "low")
+# Lower rank is more important; unknown priorities rank with "low"
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(PRIORITY_LEVELS)}
+
+# Titles whose word sets overlap at least this much are treated as the same story
+DUPLICATE_THRESHOLD = 0.7
+# Shorter tokens (version numbers, "4", "v2") carry too little signal to compare
+MIN_TOKEN_LENGTH = 3
+
+# Filler words that differ between rewordings of the same headline
+TITLE_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'of', 'to', 'for', 'and', 'in', 'on', 'at', 'by', 'with',
+    'from', 'is', 'are', 'its', 'this', 'that', 'what', 'you', 'your', 'ai'
+})
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref'})
+
+def _canonical_url(url: str) -> str:
+    """Reduce a URL to the parts that identify the page.
+
+    Drops the scheme, a leading "www.", the fragment, a trailing slash and
+    tracking parameters, so the same story linked from different feeds
+    compares equal. Links urlsplit rejects (e.g. a stray "[" in the host) are
+    returned stripped but otherwise as-is.
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key not in TRACKING_PARAMS
+    ])
+    path = parts.path.rstrip('/')
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+# Punctuation runs stripped from titles before comparison
+_PUNCT_RE = re.compile(r'[^\w\s]+')
+
+def _title_signature(title: str) -> frozenset:
+    """Reduce a title to its set of meaningful lowercase words.
+
+    Punctuation is removed inside words, so "GPT-5" becomes "gpt5" and
+    "org/model-7B" stays one token distinct from "org/model-14B".
+    """
+    words = _PUNCT_RE.sub('', title.lower()).split()
+    return frozenset(word for word in words
+                     if len(word) >= MIN_TOKEN_LENGTH and word not in TITLE_STOPWORDS)
+
+class SeenArticleStore:
+    """SQLite record of article URLs that already went into a published summary.
+
+    Feeds keep items for days and the crawl window spans several days, so
+    without this the same stories would be sent to the model on every run.
+    """
+
+    def __init__(self, db_path: Path, retention_days: int):
+        self.db_path = Path(db_path)
+        self.retention_days = retention_days
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    @classmethod
+    def from_env(cls) -> Optional['SeenArticleStore']:
+        """Store configured by AI_NEWS_SEEN_DAYS, or None when it is unset or 0"""
+        raw = os.getenv("AI_NEWS_SEEN_DAYS")
+        try:
+            retention_days = int(raw) if raw else 0
+        except ValueError:
+            logger.warning(f"Invalid integer value '{raw}' for AI_NEWS_SEEN_DAYS; not skipping seen articles")
+            return None
+        if retention_days <= 0:
+            return None
+
+        root = os.getenv("AI_NEWS_CACHE_DIR") or Path.home() / ".cache" / "ai-news-agent"
+        return cls(Path(root) / "seen.db", retention_days)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY, seen_at INTEGER NOT NULL) WITHOUT ROWID")
+        return conn
+
+    def seen_urls(self) -> Set[str]:
+        """Canonical URLs recorded within the retention period"""
+        cutoff = int(time.time()) - self.retention_days * 86400
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute("SELECT url FROM seen WHERE seen_at >= ?", (cutoff,))
+                return {url for (url,) in rows}
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning(f"Could not read seen articles from {self.db_path}: {e}")
+            return set()
+
+    def mark_seen(self, urls: Iterable[str]):
+        """Record urls as published and forget entries past the retention period"""
+        now = int(time.time())
+        keys = {_canonical_url(url) for url in urls if url}
+        keys.discard('')
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany("INSERT OR IGNORE INTO seen (url, seen_at) VALUES (?, ?)",
+                                 ((key, now) for key in keys))
+                conn.execute("DELETE FROM seen WHERE seen_at < ?", (now - self.retention_days * 86400,))
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning(f"Could not record seen articles in {self.db_path}: {e}")
+
 class AIKnowledgeCrawler:
     """Main crawler orchestrator that manages all specialized crawlers"""
 
-    def __init__(self):
+    def __init__(self, max_workers: int = 8):
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.max_workers = max_workers
         self.crawlers = self._initialize_crawlers()
+        self.seen_store = SeenArticleStore.from_env()
 
     def _initialize_crawlers(self) -> List[BaseCrawler]:
         """Initialize all specialized crawlers using configuration"""
@@ -117,27 +235,35 @@ class AIKnowledgeCrawler:
         self.logger.info(f"Initialized {len(crawlers)} crawlers")
         return crawlers
 
-    def crawl_all(self, days_back: int = 3) -> List[Article]:
-        """Execute all crawlers and collect articles"""
+    def crawl_all(self, days_back: int = 3, sink_path: Optional[str] = None) -> List[Article]:
+        """Execute all crawlers concurrently and collect articles.
+
+        If sink_path is given, each crawler's raw articles are written to it
+        as JSONL as soon as that crawler finishes, so a killed run still
+        leaves what was collected so far on disk.
+        """
         all_articles = []
 
         self.logger.info(f"Starting crawl with {len(self.crawlers)} crawlers")
 
-        for crawler in self.crawlers:
-            try:
-                start_time = time.time()
-                articles = crawler.crawl()
-                elapsed = time.time() - start_time
-
-                all_articles.extend(articles)
-                self.logger.debug(f"Crawler {crawler.name} completed in {elapsed:.2f}s")
-
-                # Brief pause between crawlers to be respectful
-                time.sleep(0.5)
-
-            except Exception as e:
-                self.logger.error(f"Crawler {crawler.name} failed: {e}")
-                continue
+        # Crawlers are network-bound, so overlap them in a thread pool; each
+        # crawler still throttles its own requests via throttle_delay
+        max_workers = max(1, min(self.max_workers, len(self.crawlers)))
+        results: List[List[Article]] = [[] for _ in self.crawlers]
+        sink_context = open(sink_path, 'wb') if sink_path else nullcontext()
+        with sink_context as sink, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._run_crawler, crawler): i
+                       for i, crawler in enumerate(self.crawlers)}
+            for future in as_completed(futures):
+                articles = future.result()
+                results[futures[future]] = articles
+                if sink is not None and articles:
+                    sink.write(b''.join(article.to_json() + b'\n' for article in articles))
+                    sink.flush()
+
+        # Merge in crawler order so deduplication keeps the same first copy
+        for articles in results:
+            all_articles.extend(articles)
 
         # Remove duplicates and sort by priority
         unique_articles = self._deduplicate(all_articles)
@@ -147,47 +273,109 @@ class AIKnowledgeCrawler:
 
         return sorted_articles
 
+    def _run_crawler(self, crawler: BaseCrawler) -> List[Article]:
+        """Run a single crawler, isolating failures from the rest of the crawl"""
+        try:
+            start_time = time.perf_counter()
+            articles = crawler.crawl()
+            elapsed = time.perf_counter() - start_time
+
+            self.logger.debug(f"Crawler {crawler.name} completed in {elapsed:.2f}s")
+            return articles
+
+        except Exception as e:
+            self.logger.error(f"Crawler {crawler.name} failed: {e}")
+            return []
+
     def _deduplicate(self, articles: List[Article]) -> List[Article]:
-        """Remove duplicate articles based on title similarity"""
-        seen_titles = set()
+        """Remove duplicate and near-duplicate articles by URL and title similarity.
+
+        Of each group of duplicates the highest-priority copy is kept, in the
+        position of the first one seen; ties keep the first.
+        """
+        low_rank = PRIORITY_RANK["low"]
+        seen_urls = {}  # canonical URL -> index into unique_articles
+        seen_signatures = []  # title signature of each unique article
+        token_index = defaultdict(list)  # title word -> indices of articles containing it
         unique_articles = []
 
         for article in articles:
-            # Normalize title for comparison
-            normalized_title = re.sub(r'[^\w\s]', '', article.title.lower())
-            title_key = ' '.join(normalized_title.split()[:8])  # First 8 words
-
-            if title_key not in seen_titles:
-                seen_titles.add(title_key)
+            # The same link reached through several crawlers is caught by an
+            # O(1) lookup before any title comparison
+            url = _canonical_url(article.url) if article.url else None
+            match = seen_urls.get(url) if url else None
+
+            if match is None:
+                signature = _title_signature(article.title)
+
+                # Count shared words through the inverted index, so only
+                # titles with some overlap are considered at all. Jaccard is
+                # shared / (|a| + |b| - shared); the earliest match wins.
+                # Within one source only the URL merges: a single feed lists
+                # distinct items (e.g. a model's size variants) under
+                # near-identical titles.
+                shared_counts = Counter()
+                for token in signature:
+                    shared_counts.update(token_index.get(token, ()))
+                size = len(signature)
+                match = min((
+                    i for i, shared in shared_counts.items()
+                    if shared >= DUPLICATE_THRESHOLD * (size + len(seen_signatures[i]) - shared)
+                    and unique_articles[i].source != article.source
+                ), default=None)
+
+            if match is None:
+                index = len(unique_articles)
+                if url:
+                    seen_urls[url] = index
+                for token in signature:
+                    token_index[token].append(index)
+                seen_signatures.append(signature)
                 unique_articles.append(article)
-            else:
-                self.logger.debug(f"Duplicate detected: {article.title[:50]}...")
+                continue
+
+            self.logger.debug("Duplicate detected: %.50s...", article.title)
+            if url:
+                seen_urls.setdefault(url, match)
+            kept = unique_articles[match]
+            if PRIORITY_RANK.get(article.priority, low_rank) < PRIORITY_RANK.get(kept.priority, low_rank):
+                unique_articles[match] = article
 
         self.logger.info(f"Deduplication: {len(articles)} -> {len(unique_articles)} articles")
         return unique_articles
 
     def _sort_by_priority(self, articles: List[Article]) -> List[Article]:
         """Sort articles by priority and recency"""
-        priority_weight = {"high": 3, "medium": 2, "low": 1}
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
 
-        def sort_key(article):
+        def date_key(article):
+            # _parse_date is memoized and the crawlers already parsed these
+            # strings for their recency checks, so this is mostly cache hits.
+            # It also reads RFC 2822 feed dates, which used to sort as undated.
             try:
-                date_obj = datetime.fromisoformat(article.date.replace('Z', '+00:00')) if article.date else datetime.min.replace(tzinfo=timezone.utc)
-                return (priority_weight.get(article.priority, 1), date_obj)
-            except:
-                return (priority_weight.get(article.priority, 1), datetime.min.replace(tzinfo=timezone.utc))
+                return _parse_date(article.date) if article.date else oldest
+            except (TypeError, ValueError, OverflowError):
+                return oldest
 
-        sorted_articles = sorted(articles, key=sort_key, reverse=True)
-        self.logger.debug(f"Sorted articles: {len([a for a in sorted_articles if a.priority == 'high'])} high priority")
+        # Priority has only three levels, so bucket by it and sort each bucket
+        # by date alone; unknown priorities rank with "low" as before
+        buckets = {priority: [] for priority in PRIORITY_LEVELS}
+        for article in articles:
+            buckets.get(article.priority, buckets["low"]).append(article)
+
+        sorted_articles = []
+        for priority in PRIORITY_LEVELS:
+            sorted_articles.extend(sorted(buckets[priority], key=date_key, reverse=True))
+
+        self.logger.debug(f"Sorted articles: {len(buckets['high'])} high priority")
 
         return sorted_articles
 
     def save_to_jsonl(self, articles: List[Article], filename: str):
         """Save articles to JSONL format"""
         try:
-            with jsonlines.open(filename, 'w') as writer:
-                for article in articles:
-                    writer.write(article.to_dict())
+            with open(filename, 'wb') as f:
+                f.write(b''.join(article.to_json() + b'\n' for article in articles))
 
             self.logger.info(f"Saved {len(articles)} articles to {filename}")
 
@@ -198,11 +386,10 @@ class AIKnowledgeCrawler:
     def save_to_json(self, articles: List[Article], filename: str):
         """Save articles to JSON format with metadata"""
         try:
-            articles_dict = [article.to_dict() for article in articles]
-
+            # orjson serializes the Article dataclasses directly
             metadata = {
-                'articles': articles_dict,
-                'total_count': len(articles_dict),
+                'articles': articles,
+                'total_count': len(articles),
                 'generated_at': datetime.now(timezone.utc).isoformat(),
                 'sources': list(set(article.source for article in articles)),
                 'crawler_version': '1.0.0',
@@ -213,8 +400,8 @@ class AIKnowledgeCrawler:
                 }
             }
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
 
             self.logger.info(f"Saved {len(articles)} articles with metadata to {filename}")
 
@@ -227,35 +414,46 @@ class AIKnowledgeCrawler:
         if not articles:
             return {}
 
-        source_counts = {}
-        tag_counts = {}
-        priority_counts = {'high': 0, 'medium': 0, 'low': 0}
+        source_counts = Counter()
+        tag_counts = Counter()
+        priority_counts = Counter(dict.fromkeys(PRIORITY_LEVELS, 0))
+        latest = ''
+        oldest = None
 
         for article in articles:
-            # Count by source
-            source_counts[article.source] = source_counts.get(article.source, 0) + 1
+            source_counts[article.source] += 1
+            priority_counts[article.priority] += 1
+            tag_counts.update(article.tags)
 
-            # Count by priority
-            priority_counts[article.priority] = priority_counts.get(article.priority, 0) + 1
-
-            # Count tags
-            for tag in article.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+            # Track the date range in the same pass; undated articles are skipped
+            if article.date:
+                if article.date > latest:
+                    latest = article.date
+                if oldest is None or article.date < oldest:
+                    oldest = article.date
 
         return {
             'total_articles': len(articles),
             'total_sources': len(source_counts),
-            'priority_breakdown': priority_counts,
-            'top_sources': dict(sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:10]),
-            'top_tags': dict(sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:15]),
-            'latest_article': max(articles, key=lambda x: x.date if x.date else '').date if articles else None,
-            'oldest_article': min(articles, key=lambda x: x.date if x.date else 'Z').date if articles else None
+            'priority_breakdown': dict(priority_counts),
+            'top_sources': dict(source_counts.most_common(10)),
+            'top_tags': dict(tag_counts.most_common(15)),
+            'latest_article': latest,
+            'oldest_article': oldest if oldest is not None else ''
         }
 
     def collect_all_news(self) -> dict:
         """Legacy method for backward compatibility - returns dict format"""
         articles = self.crawl_all()
 
+        # Drop stories a previous run already summarised
+        if self.seen_store is not None:
+            seen = self.seen_store.seen_urls()
+            if seen:
+                fresh = [article for article in articles if _canonical_url(article.url) not in seen]
+                self.logger.info(f"Skipping {len(articles) - len(fresh)} previously summarised articles")
+                articles = fresh
+
         # Convert to legacy format
         legacy_articles = []
         for article in articles:
@@ -278,6 +476,11 @@ class AIKnowledgeCrawler:
             'total_sources': len(set(a.source for a in articles))
         }
 
+    def mark_published(self, articles: List[dict]):
+        """Remember legacy-format articles as summarised, if seen tracking is enabled"""
+        if self.seen_store is not None:
+            self.seen_store.mark_seen(article['link'] for article in articles)
+
     def __str__(self) -> str:
         return f"AIKnowledgeCrawler(crawlers={len(self.crawlers)})"
 
@@ -301,8 +504,8 @@ if __name__ == "__main__":
 
     # Save in both formats
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    crawler.save_to_jsonl(f"ai_knowledge_{timestamp}.jsonl", articles)
-    crawler.save_to_json(f"ai_knowledge_{timestamp}.json", articles)
+    crawler.save_to_jsonl(articles, f"ai_knowledge_{timestamp}.jsonl")
+    crawler.save_to_json(articles, f"ai_knowledge_{timestamp}.json")
 
     # Print summary
     stats = crawler.get_stats(articles)
@@ -4,16 +4,78 @@ Updates Notion page with the generated AI news summary
 """
 
 import os
+import re
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Optional
 import logging
 
+try:
+    from .crawler_base import _BoundedRetry
+except ImportError:  # pragma: no cover - allow direct script execution
+    from crawler_base import _BoundedRetry
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Notion allows an average of ~3 requests per second per integration
+MAX_CONCURRENT_REQUESTS = 3
+
+class _NotionRetry(_BoundedRetry):
+    """Retry policy that only repeats a PATCH after a 429.
+
+    Appending children is not idempotent: after a 5xx or a dropped
+    connection the blocks may already be on the page, and a retry would add
+    them twice. A 429 means Notion rejected the request without applying it.
+    PATCH is left out of allowed_methods, so read errors are not retried
+    for it either.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == 'PATCH':
+            return status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+# Bursts above that average get 429 with a Retry-After header (waits capped
+# as for the crawlers); GET and DELETE also retry transient server errors.
+# The last response is returned (not raised) so callers log it as before.
+NOTION_RETRY = _NotionRetry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'DELETE']),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Inline markdown the summaries use: **bold** runs and [label](url) links.
+# The capturing group makes re.split keep the matched tokens.
+_INLINE_MARKDOWN_RE = re.compile(r'(\*\*[^*]+\*\*|\[[^\]]+\]\([^)]+\))')
+
+# Line prefixes that select the block type, and whether the rest of the
+# line may carry inline markdown; anything else becomes a paragraph
+_LINE_PREFIXES = (
+    ('## ', "heading_2", False),
+    ('### ', "heading_3", False),
+    ('- ', "bulleted_list_item", True),
+)
+
+def _plain_rich_text(content: str) -> list:
+    """Rich text array holding a single unformatted text run"""
+    return [{"type": "text", "text": {"content": content}}]
+
+def _make_block(block_type: str, rich_text: list) -> dict:
+    """Build a Notion block of the given type around a rich text array"""
+    return {
+        "object": "block",
+        "type": block_type,
+        block_type: {"rich_text": rich_text}
+    }
+
 class NotionUpdater:
     def __init__(self):
         self.token = os.getenv('NOTION_TOKEN')
@@ -31,136 +93,173 @@ class NotionUpdater:
             'Content-Type': 'application/json',
             'Notion-Version': self.version
         }
+
+        # Reuse one keep-alive connection pool for every API call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(max_retries=NOTION_RETRY))
     
     def convert_markdown_to_blocks(self, markdown_content: str) -> list:
-        """Convert markdown content to Notion blocks"""
+        """Convert markdown content to Notion blocks (one block per non-empty line)"""
         blocks = []
-        lines = markdown_content.split('\n')
-        current_block = None
         
-        for line in lines:
+        for line in markdown_content.splitlines():
             line = line.strip()
             
             if not line:  # Empty line
-                if current_block:
-                    blocks.append(current_block)
-                    current_block = None
                 continue
             
-            # Handle headings
-            if line.startswith('## '):
-                if current_block:
-                    blocks.append(current_block)
-                current_block = {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [{"type": "text", "text": {"content": line[3:]}}]
-                    }
-                }
-            elif line.startswith('### '):
-                if current_block:
-                    blocks.append(current_block)
-                current_block = {
-                    "object": "block",
-                    "type": "heading_3",
-                    "heading_3": {
-                        "rich_text": [{"type": "text", "text": {"content": line[4:]}}]
-                    }
-                }
-            # Handle bullet points
-            elif line.startswith('- '):
-                if current_block and current_block.get("type") != "bulleted_list_item":
-                    blocks.append(current_block)
-                    current_block = None
-                
-                content = line[2:]
-                rich_text = self.parse_rich_text(content)
-                
-                block = {
-                    "object": "block",
-                    "type": "bulleted_list_item",
-                    "bulleted_list_item": {
-                        "rich_text": rich_text
-                    }
-                }
-                blocks.append(block)
-            # Handle regular paragraphs
+            for prefix, block_type, inline_markdown in _LINE_PREFIXES:
+                if line.startswith(prefix):
+                    text = line[len(prefix):]
+                    break
             else:
-                if current_block:
-                    blocks.append(current_block)
-                
-                rich_text = self.parse_rich_text(line)
-                current_block = {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": rich_text
-                    }
-                }
-        
-        # Add the last block
-        if current_block:
-            blocks.append(current_block)
+                # Regular paragraph
+                text, block_type, inline_markdown = line, "paragraph", True
+            
+            rich_text = self.parse_rich_text(text) if inline_markdown else _plain_rich_text(text)
+            blocks.append(_make_block(block_type, rich_text))
         
         return blocks
     
     def parse_rich_text(self, text: str) -> list:
         """Parse text with markdown formatting into Notion rich text format"""
-        return [{"type": "text", "text": {"content": text}}]
+        # Most lines carry no inline formatting
+        if '**' not in text and '[' not in text:
+            return _plain_rich_text(text)
+        
+        rich_text = []
+        # Even indices are plain text between matches, odd indices are matches
+        for i, token in enumerate(_INLINE_MARKDOWN_RE.split(text)):
+            if not token:
+                continue
+            
+            if i % 2 == 0:
+                rich_text.append({"type": "text", "text": {"content": token}})
+            elif token.startswith('**'):
+                rich_text.append({
+                    "type": "text",
+                    "text": {"content": token[2:-2]},
+                    "annotations": {"bold": True}
+                })
+            else:
+                label, url = token[1:-1].split('](', 1)
+                run = {"type": "text", "text": {"content": label}}
+                # Notion rejects the whole request for non-absolute URLs (e.g. '#')
+                if url.startswith(('http://', 'https://')):
+                    run["text"]["link"] = {"url": url}
+                rich_text.append(run)
+        
+        return rich_text
     
-    def clear_page_content(self) -> bool:
-        """Clear existing content from the Notion page"""
-        try:
-            response = requests.get(
+    def _get_child_block_ids(self) -> Optional[list]:
+        """Return the ids of the page's current top-level blocks, or None on failure"""
+        block_ids = []
+        params = {"page_size": 100}
+        
+        # Notion returns at most 100 children per request; follow the cursor
+        # so long pages are cleared completely
+        while True:
+            response = self.session.get(
                 f"{self.base_url}/blocks/{self.page_id}/children",
-                headers=self.headers
+                params=params
             )
             
             if response.status_code != 200:
                 logger.error(f"Failed to get page blocks: {response.text}")
-                return False
+                return None
             
-            blocks = response.json().get('results', [])
+            data = response.json()
+            block_ids.extend(block['id'] for block in data.get('results', []))
             
-            for block in blocks:
-                delete_response = requests.delete(
-                    f"{self.base_url}/blocks/{block['id']}",
-                    headers=self.headers
-                )
-                if delete_response.status_code not in [200, 404]:
-                    logger.warning(f"Failed to delete block {block['id']}")
+            if not data.get('has_more'):
+                return block_ids
+            params["start_cursor"] = data['next_cursor']
+    
+    def _delete_blocks(self, block_ids: list, max_workers: int = MAX_CONCURRENT_REQUESTS):
+        """Delete blocks concurrently, since each delete is an independent round-trip"""
+        if block_ids:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(self._delete_block, block_ids))
+        
+        logger.info(f"Cleared {len(block_ids)} blocks from page")
+    
+    def _delete_block(self, block_id: str) -> bool:
+        """Delete a single block, logging (but tolerating) failures"""
+        delete_response = self.session.delete(f"{self.base_url}/blocks/{block_id}")
+        if delete_response.status_code not in [200, 404]:
+            logger.warning(f"Failed to delete block {block_id}")
+            return False
+        return True
+    
+    def clear_page_content(self) -> bool:
+        """Clear existing content from the Notion page"""
+        try:
+            block_ids = self._get_child_block_ids()
+            if block_ids is None:
+                return False
             
-            logger.info(f"Cleared {len(blocks)} blocks from page")
+            self._delete_blocks(block_ids)
             return True
             
         except Exception as e:
             logger.error(f"Error clearing page content: {e}")
             return False
     
+    def _append_blocks(self, blocks: list) -> bool:
+        """Append blocks to the page in order, 100 children per request"""
+        chunk_size = 100
+        for i in range(0, len(blocks), chunk_size):
+            chunk = blocks[i:i + chunk_size]
+            
+            payload = {"children": chunk}
+            
+            response = self.session.patch(
+                f"{self.base_url}/blocks/{self.page_id}/children",
+                json=payload
+            )
+            
+            if response.status_code != 200:
+                logger.error(f"Failed to update page: {response.text}")
+                return False
+        
+        return True
+    
     def update_page_content(self, markdown_content: str) -> bool:
         """Update the Notion page with new content"""
         try:
-            if not self.clear_page_content():
-                logger.warning("Failed to clear existing content, proceeding anyway")
-            
             blocks = self.convert_markdown_to_blocks(markdown_content)
             
-            chunk_size = 100
-            for i in range(0, len(blocks), chunk_size):
-                chunk = blocks[i:i + chunk_size]
-                
-                payload = {"children": chunk}
-                
-                response = requests.patch(
-                    f"{self.base_url}/blocks/{self.page_id}/children",
-                    headers=self.headers,
-                    json=payload
+            # Snapshot the existing blocks before appending anything. New blocks
+            # land after them, so deleting the snapshot can overlap the uploads.
+            # The uploads themselves stay serial to preserve block order.
+            try:
+                old_block_ids = self._get_child_block_ids()
+            except Exception as e:
+                logger.error(f"Error clearing page content: {e}")
+                old_block_ids = None
+            
+            if old_block_ids is None:
+                logger.warning("Failed to clear existing content, proceeding anyway")
+                old_block_ids = []
+            
+            # Clear the snapshot in the background while this thread uploads,
+            # through the same _delete_blocks path as clear_page_content. Notion
+            # limits the average request rate, not concurrency, so bursts past
+            # it can still draw 429s; NOTION_RETRY waits out Retry-After.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                clearing = executor.submit(
+                    self._delete_blocks, old_block_ids, max(1, MAX_CONCURRENT_REQUESTS - 1)
                 )
+                appended = self._append_blocks(blocks)
                 
-                if response.status_code != 200:
-                    logger.error(f"Failed to update page: {response.text}")
-                    return False
+                try:
+                    clearing.result()
+                except Exception as e:
+                    logger.warning(f"Failed to clear existing content: {e}")
+            
+            if not appended:
+                return False
             
             logger.info(f"Successfully updated Notion page with {len(blocks)} blocks")
             return True
@@ -172,9 +271,8 @@ class NotionUpdater:
     def test_connection(self) -> bool:
         """Test connection to Notion API"""
         try:
-            response = requests.get(
-                f"{self.base_url}/pages/{self.page_id}",
-                headers=self.headers
+            response = self.session.get(
+                f"{self.base_url}/pages/{self.page_id}"
             )
             
             if response.status_code == 200:
@@ -189,7 +287,7 @@ class NotionUpdater:
             return False
 
 if __name__ == "__main__":
-    if os.getenv('NOTION_TOKEN') and os.getenv('NOTION_PAGE_ID'):
+    if os.environ.get('NOTION_TOKEN') and os.environ.get('NOTION_PAGE_ID'):
         updater = NotionUpdater()
         if updater.test_connection():
             print("✅ Notion connection successful")
@@ -10,7 +10,7 @@ import logging
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from news_collector import AIKnowledgeCrawler
+from news_collector import AIKnowledgeCrawler, PRIORITY_RANK
 from crawlers import RSSCrawler
 from crawler_config import CrawlerConfig
 
@@ -31,6 +31,9 @@ def test_config():
     print(f"✅ Implementation sources: {len(sources['implementation'])}")
     print(f"✅ Institute sources: {len(sources['institutes'])}")
 
+    # Sources are built once per process, not per call or instance
+    assert CrawlerConfig().get_all_sources() is sources
+
 def test_single_rss_crawler():
     """Test a single RSS crawler"""
     print("\n🧪 Testing single RSS crawler...")
@@ -81,8 +84,9 @@ def test_framework():
         # Test sorting
         print("🧪 Testing priority sorting...")
         sorted_articles = crawler._sort_by_priority(articles)
+        # Compare ranks, not the priority strings ('high' < 'low' as text)
         high_priority_first = all(
-            sorted_articles[i].priority >= sorted_articles[i+1].priority
+            PRIORITY_RANK[sorted_articles[i].priority] <= PRIORITY_RANK[sorted_articles[i+1].priority]
             for i in range(min(5, len(sorted_articles)-1))
         )
         print(f"✅ Priority sorting working: {high_priority_first}")
@@ -135,6 +139,271 @@ def test_article_schema():
     article_str = str(article)
     print(f"✅ String representation: {article_str[:50]}...")
 
+def test_keyword_matching():
+    """Test AI keyword matching with and without the Aho-Corasick automaton"""
+    print("\n🧪 Testing keyword matching...")
+
+    from crawler_base import KeywordMatcher
+
+    matcher = KeywordMatcher(['Machine Learning', 'llm', 'gpt'])
+    fallback = KeywordMatcher(['Machine Learning', 'llm', 'gpt'])
+    fallback._automaton = None
+
+    for m in (matcher, fallback):
+        assert m.search("new machine learning benchmark")
+        assert m.search("chatgpt update")
+        assert not m.search("quarterly earnings report")
+        assert not m.search("")
+
+    assert not KeywordMatcher([]).search("anything")
+    print("✅ Keyword matching working")
+
+def test_near_duplicate_detection():
+    """Test that reworded titles from different sources are deduplicated"""
+    print("\n🧪 Testing near-duplicate detection...")
+
+    from crawler_base import Article
+
+    def make(title, source, url=None):
+        return Article(title=title, authors=[], date="", url=url or f"https://example.com/{source}",
+                       tags=["test"], source=source)
+
+    articles = [
+        make("OpenAI announces GPT-5", "A"),
+        make("OpenAI Announces GPT-5!", "B"),
+        make("Meta releases Llama 4 weights", "C"),
+        make("OpenAI Announces GPT-5: What to Know", "D"),
+        make("Llama 4 is out", "E", "http://www.example.com/C/?utm_source=rss#comments"),
+        # Malformed links (urlsplit raises on them) must not abort the crawl
+        make("Anthropic publishes interpretability results", "F", "http://[abc/x"),
+    ]
+
+    crawler = AIKnowledgeCrawler()
+    unique = crawler._deduplicate(articles + articles)
+    assert [a.source for a in unique] == ["A", "C", "F"]
+
+    # A higher-priority copy replaces the one seen first
+    articles[1].priority = "high"
+    assert [a.source for a in crawler._deduplicate(articles)] == ["B", "C", "F"]
+
+    # Different stories that share most of their wording stay separate,
+    # whether they come from different sources or the same one
+    distinct_pairs = [
+        ("Introducing Claude 3.5 Sonnet", "Introducing Claude 3.5 Haiku"),
+        ("OpenAI releases GPT-4", "OpenAI releases GPT-5"),
+        ("New Model: Qwen/Qwen2.5-7B", "New Model: Qwen/Qwen2.5-14B"),
+        ("New Model: meta-llama/Llama-3.1-8B-Instruct", "New Model: meta-llama/Llama-3.1-70B-Instruct"),
+        ("Trending: microsoft/autogen", "Trending: microsoft/autogen-studio"),
+    ]
+    for first, second in distinct_pairs:
+        for second_source in ("X", "Y"):
+            pair = [make(first, "X", "https://example.com/1"),
+                    make(second, second_source, "https://example.com/2")]
+            assert len(crawler._deduplicate(pair)) == 2, (first, second)
+
+    # A shared lead-in ("<org> launches <product> ...") is not the same story
+    shared_prefix = [
+        make("Anthropic launches Claude for Enterprise", "X", "https://example.com/3"),
+        make("Anthropic launches Claude for Education", "Y", "https://example.com/4"),
+        make("Meta releases Llama 4 Scout", "X", "https://example.com/5"),
+        make("Meta releases Llama 4 Maverick", "Y", "https://example.com/6"),
+    ]
+    assert crawler._deduplicate(shared_prefix) == shared_prefix
+    print(f"✅ Near-duplicate detection working: {len(articles) * 2} -> {len(unique)}")
+
+def test_feed_cache_conditional_fetch():
+    """Test conditional feed fetches against a stubbed make_request"""
+    print("\n🧪 Testing feed cache...")
+
+    import tempfile
+    import requests
+    from crawler_base import FeedCache
+
+    url = "https://example.com/feed.xml"
+
+    def response(status, body=b"", headers=None):
+        r = requests.Response()
+        r.status_code = status
+        r._content = body
+        r.headers.update(headers or {})
+        return r
+
+    with tempfile.TemporaryDirectory() as tmp:
+        crawler = RSSCrawler("Cache Test", url, ["test"])
+        crawler.feed_cache = FeedCache(tmp)
+        sent = []
+        replies = []
+
+        def fake_request(request_url, headers=None, **kwargs):
+            sent.append(dict(headers or {}))
+            reply = replies.pop(0)
+            return reply() if callable(reply) else reply
+
+        crawler.make_request = fake_request
+
+        # First fetch sends no validators and stores the body
+        replies.append(response(200, b"<rss>v1</rss>", {
+            'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT',
+            'Content-Type': 'application/rss+xml'}))
+        assert crawler.fetch_cached(url) == (b"<rss>v1</rss>", 'application/rss+xml')
+        assert 'If-None-Match' not in sent[0]
+
+        # Second fetch sends them, and a 304 returns the cached copy
+        replies.append(response(304))
+        assert crawler.fetch_cached(url) == (b"<rss>v1</rss>", 'application/rss+xml')
+        assert sent[1]['If-None-Match'] == '"v1"'
+        assert sent[1]['If-Modified-Since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+        # A 304 whose cached body has gone missing triggers a plain refetch
+        def not_modified_after_losing_body():
+            for path in crawler.feed_cache._paths(url):
+                path.unlink()
+            return response(304)
+
+        replies.extend([not_modified_after_losing_body, response(200, b"<rss>v2</rss>")])
+        assert crawler.fetch_cached(url) == (b"<rss>v2</rss>", None)
+        assert 'If-None-Match' in sent[2]
+        assert 'If-None-Match' not in sent[3] and 'If-Modified-Since' not in sent[3]
+        assert not replies
+
+    print("✅ Feed cache working")
+
+def test_notion_rich_text():
+    """Test inline markdown conversion to Notion rich text"""
+    print("\n🧪 Testing Notion rich text...")
+
+    os.environ.setdefault("NOTION_TOKEN", "test-token")
+    os.environ.setdefault("NOTION_PAGE_ID", "test-page")
+    from notion_updater import NotionUpdater
+
+    parse = NotionUpdater().parse_rich_text
+
+    def text(content, **extra):
+        return {"type": "text", "text": {"content": content}, **extra}
+
+    assert parse("Plain text") == [text("Plain text")]
+    assert parse("**Bold**") == [text("Bold", annotations={"bold": True})]
+    assert parse("[Label](https://example.com/a)") == [
+        {"type": "text", "text": {"content": "Label", "link": {"url": "https://example.com/a"}}}
+    ]
+    # Notion rejects relative links, so they render as plain text
+    assert parse("[Read more](#)") == [text("Read more")]
+    assert parse("See **GPT-5** in [the post](https://example.com/p) today") == [
+        text("See "),
+        text("GPT-5", annotations={"bold": True}),
+        text(" in "),
+        {"type": "text", "text": {"content": "the post", "link": {"url": "https://example.com/p"}}},
+        text(" today"),
+    ]
+    print("✅ Notion rich text working")
+
+def test_notion_retry_policy():
+    """Test that block appends are only retried when Notion throttled them"""
+    print("\n🧪 Testing Notion retry policy...")
+
+    from notion_updater import NOTION_RETRY
+
+    # A 5xx may arrive after the append was applied; repeating it duplicates blocks
+    assert NOTION_RETRY.is_retry('PATCH', 429, has_retry_after=True)
+    assert not NOTION_RETRY.is_retry('PATCH', 502)
+    assert 'PATCH' not in NOTION_RETRY.allowed_methods
+    for method in ('GET', 'DELETE'):
+        assert NOTION_RETRY.is_retry(method, 429, has_retry_after=True)
+        assert NOTION_RETRY.is_retry(method, 502)
+    print("✅ Notion retry policy working")
+
+def test_seen_article_store():
+    """Test that published URLs round-trip through the store and expire"""
+    print("\n🧪 Testing seen article store...")
+
+    import tempfile
+    import time
+    from contextlib import closing
+    from pathlib import Path
+    from news_collector import SeenArticleStore, _canonical_url
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SeenArticleStore(Path(tmp) / "seen.db", retention_days=7)
+        assert store.seen_urls() == set()
+
+        # URLs are stored canonically, so other links to the same page match
+        store.mark_seen(["https://www.example.com/post/?utm_source=rss", "", "https://example.com/other",
+                         " http://[abc/x "])
+        seen = store.seen_urls()
+        assert seen == {_canonical_url("http://example.com/post"), _canonical_url("https://example.com/other"),
+                        "http://[abc/x"}
+
+        # Entries older than the retention period are ignored, then pruned
+        old = int(time.time()) - 8 * 86400
+        with closing(store._connect()) as conn, conn:
+            conn.execute("INSERT INTO seen (url, seen_at) VALUES (?, ?)", ("example.com/old", old))
+        assert "example.com/old" not in store.seen_urls()
+
+        store.mark_seen(["https://example.com/new"])
+        with closing(store._connect()) as conn:
+            stored = {url for (url,) in conn.execute("SELECT url FROM seen")}
+        assert "example.com/old" not in stored
+        assert stored == seen | {"example.com/new"}
+
+    print("✅ Seen article store working")
+
+def test_fallback_summary_detection():
+    """Test that fallback summaries can be told apart from model output"""
+    print("\n🧪 Testing fallback summary detection...")
+
+    os.environ.setdefault("AI_SUMMARIZER_API_KEY", "test-key")
+    from ai_summarizer import AISummarizer
+
+    summarizer = AISummarizer()
+    news_data = {'articles': [{'title': 'T', 'source': 'S', 'summary': 'Body', 'link': 'https://example.com/t'}]}
+
+    assert summarizer.is_fallback_summary(summarizer.create_fallback_summary(news_data))
+    assert not summarizer.is_fallback_summary("## Today\n\n### Overview\nModel output")
+    print("✅ Fallback summary detection working")
+
+def test_summary_cache():
+    """Test that cached summaries skip the provider until they expire"""
+    print("\n🧪 Testing summary cache...")
+
+    import tempfile
+    import time
+    from pathlib import Path
+
+    os.environ.setdefault("AI_SUMMARIZER_API_KEY", "test-key")
+    import ai_summarizer
+
+    calls = []
+
+    def fake_completion(**kwargs):
+        calls.append(kwargs)
+        return {"choices": [{"message": {"content": f"## Summary {len(calls)}"}}]}
+
+    news_data = {'articles': [{'title': 'T', 'source': 'S', 'summary': 'Body', 'published': '2024-01-01',
+                               'link': 'https://example.com/t'}]}
+    original = ai_summarizer._litellm_completion
+    ai_summarizer._litellm_completion = lambda: fake_completion
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            summarizer = ai_summarizer.AISummarizer()
+            summarizer.cache_hours = 1
+            summarizer.cache_dir = Path(tmp)
+
+            # An identical request within cache_hours never reaches the provider
+            assert summarizer.generate_summary(news_data) == "## Summary 1"
+            assert summarizer.generate_summary(news_data) == "## Summary 1"
+            assert len(calls) == 1
+
+            # Once the file is older than cache_hours it is ignored and replaced
+            expired = time.time() - 2 * 3600
+            for path in Path(tmp).iterdir():
+                os.utime(path, (expired, expired))
+            assert summarizer.generate_summary(news_data) == "## Summary 2"
+            assert len(calls) == 2
+    finally:
+        ai_summarizer._litellm_completion = original
+
+    print("✅ Summary cache working")
+
 def main():
     """Run all tests"""
     print("🚀 AI Knowledge Crawler Framework - Test Suite")
@@ -143,6 +412,14 @@ def main():
     try:
         test_config()
         test_article_schema()
+        test_keyword_matching()
+        test_near_duplicate_detection()
+        test_feed_cache_conditional_fetch()
+        test_notion_rich_text()
+        test_notion_retry_policy()
+        test_seen_article_store()
+        test_fallback_summary_detection()
+        test_summary_cache()
         test_single_rss_crawler()
         test_framework()
 